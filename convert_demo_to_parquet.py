@@ -0,0 +1,47 @@
+"""
+One-time conversion of the demo CSVs in data/ to Parquet.
+
+The dashboard prefers the Parquet files when they exist: the columnar
+binary load is ~10x faster than CSV parsing and stock_in_at comes back
+already typed as datetime64, so no string parsing is needed at load time.
+
+Usage:
+    python convert_demo_to_parquet.py
+"""
+
+import pandas as pd
+from pathlib import Path
+
+DATA_DIR = Path("data")
+
+# (source CSV, target Parquet)
+CONVERSIONS = [
+    ("df DBU.csv", "df_dbu.parquet"),
+    ("df roissy.csv", "df_roissy.parquet"),
+]
+
+DATE_COLUMNS = ("stock_in_at", "dbu_stock_in_at")
+
+
+def main():
+    for csv_name, parquet_name in CONVERSIONS:
+        src = DATA_DIR / csv_name
+        dst = DATA_DIR / parquet_name
+
+        if not src.exists():
+            print(f"skip: {src} not found")
+            continue
+
+        df = pd.read_csv(src)
+        df.columns = [c.lower() for c in df.columns]
+
+        for col in DATE_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col])
+
+        df.to_parquet(dst, engine="pyarrow", index=False)
+        print(f"{src} -> {dst} ({len(df)} rows)")
+
+
+if __name__ == "__main__":
+    main()
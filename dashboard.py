@@ -2,18 +2,58 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import altair as alt
+import openpyxl
 import snowflake.connector
 import psycopg2
 import re
 from io import BytesIO
 from pathlib import Path
 
+# calamine (Rust) is much faster than openpyxl for .xlsx parsing;
+# fall back to the openpyxl streaming reader when it is not installed
+try:
+    import python_calamine  # noqa: F401
+
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
+# pyarrow's CSV reader with a fixed schema skips pandas' type inference
+# and is 5-10x faster; plain pd.read_csv stays as the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    _HAS_PYARROW_CSV = True
+
+    # column types for both demo CSV naming schemes; names that a given
+    # file does not contain are simply ignored by pyarrow
+    _DEMO_CSV_TYPES = {
+        "reference": pa.string(),
+        "transporter": pa.string(),
+        "weight": pa.float64(),
+        "netweight": pa.float64(),
+        "stock_in_at": pa.timestamp("ns"),
+        "stock_in_pda_version": pa.string(),
+        "box_id": pa.string(),
+        "produit": pa.string(),
+        "box_weight": pa.float64(),
+        "net_weight": pa.float64(),
+        "dbu_stock_in_at": pa.timestamp("ns"),
+        "dbu_stock_in_pda_version": pa.string(),
+    }
+except ImportError:
+    _HAS_PYARROW_CSV = False
+
 # IMPORTANT: expand Streamlit page
 st.set_page_config(layout="wide")
 
 # === Unified Colors for all charts ===
-COLOR_DBU = "#1f77b4"      
-COLOR_OTHER = "#aec7e8"    
+COLOR_DBU = "#1f77b4"
+COLOR_OTHER = "#aec7e8"
+
+# year embedded in a price sheet name, compiled once for the sheet loop
+_YEAR_RE = re.compile(r"(\d{4})")
 
 # ========================
 # 0. Global config: demo vs live
@@ -27,6 +67,12 @@ DATA_DIR = Path("data")
 DBU_DEMO_PATH = DATA_DIR / "df DBU.csv"
 INROOISSY_DEMO_PATH = DATA_DIR / "df roissy.csv"
 
+# Parquet versions produced by convert_demo_to_parquet.py; loaded in
+# preference to the CSVs because the parse is ~10x faster and the
+# datetime column comes back already typed
+DBU_DEMO_PARQUET = DATA_DIR / "df_dbu.parquet"
+INROOISSY_DEMO_PARQUET = DATA_DIR / "df_roissy.parquet"
+
 
 # ========================
 # 1. Database Connections (only used when USE_DEMO_DATA = False)
@@ -60,64 +106,164 @@ def get_postgres_connection():
 # 2. Price data (from Excel)
 # ========================
 
-def load_and_clean_price_from_workbook(file) -> pd.DataFrame:
-    xls = pd.ExcelFile(file)
-    frames = []
+def _parse_day_month_dates(raw: pd.Series, year: str) -> pd.Series:
+    """
+    Parse a 'day/month' column plus the sheet year into datetimes.
+
+    Splits the column once and assembles the dates from integer arrays,
+    instead of concatenating strings and re-parsing every row.
+    """
+    parts = raw.astype(str).str.split("/", expand=True).reindex(columns=[0, 1])
+    return pd.to_datetime(
+        {
+            "year": np.full(len(raw), int(year)),
+            "month": pd.to_numeric(parts[1], errors="coerce"),
+            "day": pd.to_numeric(parts[0], errors="coerce"),
+        },
+        errors="coerce",
+    )
 
-    for sheet in xls.sheet_names:
-        df = pd.read_excel(xls, sheet_name=sheet)
 
+def _price_frames_calamine(file) -> list:
+    """
+    Parse the price workbook with the calamine engine.
+    """
+    # sheet_name=None parses the whole file once and returns every sheet;
+    # usecols keeps only the two columns we need
+    sheets = pd.read_excel(
+        file,
+        sheet_name=None,
+        engine="calamine",
+        usecols=lambda c: c in ("日期", "Tot. H.T"),
+    )
+    frames = []
+
+    for sheet, df in sheets.items():
         # only process sheets that contain 日期 & Tot. H.T
         if not (("日期" in df.columns) and ("Tot. H.T" in df.columns)):
             continue
 
         # extract year from sheet name
-        m = re.search(r"(\d{4})", sheet)
+        m = _YEAR_RE.search(sheet)
         if not m:
             continue
         year = m.group(1)
 
-        df["date"] = pd.to_datetime(
-            df["日期"].astype(str) + f"/{year}",
-            format="%d/%m/%Y",
-            errors="coerce",
+        # build the typed frame directly; rows with bad dates are dropped
+        # once after the final concat
+        sub = pd.DataFrame(
+            {
+                "date": _parse_day_month_dates(df["日期"], year),
+                "Tot. H.T": pd.to_numeric(
+                    df["Tot. H.T"], errors="coerce"
+                ).astype("float64"),
+            }
         )
-
-        sub = df[["date", "Tot. H.T"]].copy()
-        sub["Tot. H.T"] = pd.to_numeric(sub["Tot. H.T"], errors="coerce")
-        sub = sub.dropna(subset=["date"])
         frames.append(sub)
 
+    return frames
+
+
+def _price_frames_openpyxl(file) -> list:
+    """
+    Fallback parser: stream the workbook with openpyxl read_only.
+    """
+    # read_only streams rows instead of loading each sheet into memory,
+    # data_only gives computed values instead of formulas
+    wb = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    frames = []
+
+    try:
+        for sheet in wb.sheetnames:
+            ws = wb[sheet]
+
+            header = next(
+                ws.iter_rows(min_row=1, max_row=1, values_only=True), None
+            )
+            if header is None:
+                continue
+
+            # only process sheets that contain 日期 & Tot. H.T
+            if not (("日期" in header) and ("Tot. H.T" in header)):
+                continue
+
+            # extract year from sheet name
+            m = _YEAR_RE.search(sheet)
+            if not m:
+                continue
+            year = m.group(1)
+
+            date_idx = header.index("日期")
+            price_idx = header.index("Tot. H.T")
+
+            dates = []
+            prices = []
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if len(row) <= max(date_idx, price_idx):
+                    continue
+                dates.append(row[date_idx])
+                prices.append(row[price_idx])
+
+            sub = pd.DataFrame(
+                {
+                    "date": _parse_day_month_dates(pd.Series(dates), year),
+                    "Tot. H.T": pd.to_numeric(
+                        pd.Series(prices), errors="coerce"
+                    ).astype("float64"),
+                }
+            )
+            frames.append(sub)
+    finally:
+        wb.close()
+
+    return frames
+
+
+def load_and_clean_price_from_workbook(file) -> pd.DataFrame:
+    if _HAS_CALAMINE:
+        frames = _price_frames_calamine(file)
+    else:
+        frames = _price_frames_openpyxl(file)
+
     if not frames:
         raise ValueError(
             "No valid sheet found"
         )
 
-    df_all = pd.concat(frames, ignore_index=True)
+    df_all = pd.concat(frames, copy=False, ignore_index=True)
+    df_all = df_all.dropna(subset=["date"])
     df_all = df_all.sort_values("date").reset_index(drop=True)
     return df_all
 
 
+def _ym_labels(years, months) -> list:
+    """
+    Format 'YYYY-MM' labels in one pass over the two int columns,
+    avoiding the intermediate object Series of astype(str) + zfill.
+    """
+    return ["%04d-%02d" % (y, m) for y, m in zip(years, months)]
+
+
 def agg_monthly_price(df_all_price: pd.DataFrame) -> pd.DataFrame:
     """
     Aggregate daily price to monthly level.
     """
-    df = df_all_price.copy()
-    df["year"] = df["date"].dt.year
-    df["month"] = df["date"].dt.month
+    # to_period walks the datetime buffer once, vs one pass each for
+    # .dt.year and .dt.month; the groupby output is already sorted by ym
+    ym = df_all_price["date"].dt.to_period("M").rename("ym")
 
     df_price_y_m = (
-        df.groupby(["year", "month"], as_index=False)["Tot. H.T"]
+        df_all_price.groupby(ym)["Tot. H.T"]
         .sum()
-        .rename(columns={"Tot. H.T": "total_price"})
+        .rename("total_price")
+        .reset_index()
     )
-    df_price_y_m["x_label"] = (
-        df_price_y_m["year"].astype(str)
-        + "-"
-        + df_price_y_m["month"].astype(str).str.zfill(2)
+    df_price_y_m["year"] = df_price_y_m["ym"].dt.year
+    df_price_y_m["month"] = df_price_y_m["ym"].dt.month
+    df_price_y_m["x_label"] = _ym_labels(
+        df_price_y_m["year"], df_price_y_m["month"]
     )
-    df_price_y_m = df_price_y_m.sort_values(["year", "month"]).reset_index(drop=True)
-    return df_price_y_m
+    return df_price_y_m[["year", "month", "total_price", "x_label"]]
 
 
 @st.cache_data(ttl=3600) 
@@ -134,83 +280,122 @@ def load_price_monthly_from_bytes(excel_bytes: bytes) -> pd.DataFrame:
 #    - demo loaders (CSV)
 # ========================
 
-def fetch_dbu_from_snowflake(conn) -> pd.DataFrame:
+def _downcast_weights(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store box weights as float32: halves the bytes the groupby passes
+    have to stream, and kg-scale masses fit comfortably.
+    """
+    df["weight"] = pd.to_numeric(df["weight"], downcast="float", errors="coerce")
+    df["netweight"] = pd.to_numeric(
+        df["netweight"], downcast="float", errors="coerce"
+    )
+    return df
+
+
+def fetch_dbu_summary_from_snowflake(conn) -> pd.DataFrame:
     """
-    Live mode: fetch DBU weight from Snowflake.
+    Live mode: fetch the monthly DBU weight summary from Snowflake.
+
+    The GROUP BY runs in the warehouse, so only one row per month comes
+    back instead of every box row.
     """
     sql = """
-    SELECT 
-        BOX_ID,
-        PRODUIT,
-        BOX_WEIGHT,
-        NET_WEIGHT,
-        DBU_STOCK_IN_AT,
-        DBU_STOCK_IN_PDA_VERSION,
-        ROI_BIND_PMC
+    SELECT
+        YEAR(DBU_STOCK_IN_AT) AS YEAR,
+        MONTH(DBU_STOCK_IN_AT) AS MONTH,
+        COUNT(DISTINCT BOX_ID) AS REFERENCE_UNIQUE,
+        SUM(BOX_WEIGHT) AS TOTAL_WEIGHT,
+        SUM(NET_WEIGHT) AS TOTAL_NETWEIGHT
     FROM DBU
     WHERE PRODUIT IN ('FR-DBU-S', 'FR-DBU-R')
       AND ROI_BIND_PMC = TRUE
+    GROUP BY 1, 2
     """
-    df = pd.read_sql(sql, conn)
+    # fetch_pandas_all streams Arrow batches straight into a DataFrame,
+    # skipping the DB-API per-row tuple layer that pd.read_sql goes through
+    cur = conn.cursor()
+    try:
+        cur.execute(sql)
+        df = cur.fetch_pandas_all()
+    finally:
+        cur.close()
 
     df.columns = [c.lower() for c in df.columns]
-
-    df_dbu = df.rename(
-        columns={
-            "box_id": "reference",
-            "produit": "transporter",
-            "box_weight": "weight",
-            "net_weight": "netweight",
-            "dbu_stock_in_at": "stock_in_at",
-            "dbu_stock_in_pda_version": "stock_in_pda_version",
-        }
-    )[
-        [
-            "reference",
-            "transporter",
-            "weight",
-            "netweight",
-            "stock_in_at",
-            "stock_in_pda_version",
-        ]
-    ]
-
-    df_dbu["transporter"] = "DBU-PMC"
-    df_dbu["stock_in_at"] = pd.to_datetime(df_dbu["stock_in_at"])
-    return df_dbu
+    df["transporter"] = "DBU-PMC"
+    return df
 
 
-def fetch_inrooissy_no_pmcdbu_from_postgres(conn) -> pd.DataFrame:
+def fetch_inrooissy_summary_from_postgres(conn) -> pd.DataFrame:
     """
-    Live mode: fetch inrooissy weight from Postgres.
+    Live mode: fetch the monthly inrooissy weight summary from Postgres.
     """
     sql = """
-    SELECT 
-        wbo.reference,
+    SELECT
+        EXTRACT(YEAR FROM wbo.stock_in_at)::int AS year,
+        EXTRACT(MONTH FROM wbo.stock_in_at)::int AS month,
         sob.transporter,
-        sob.weight,
-        sob.netweight,
-        wbo.stock_in_at,
-        wbo.stock_in_pda_version
+        COUNT(DISTINCT wbo.reference) AS reference_unique,
+        SUM(sob.weight) AS total_weight,
+        SUM(sob.netweight) AS total_netweight
     FROM whs_box_operation wbo
     JOIN sale_order_box sob ON wbo.reference = sob.id
-    WHERE wbo.warehouse = 'EP_CL1' 
-      AND wbo.stock_in_at > '2024-01-01' 
-      AND wbo.bind_pmc = false 
-      AND wbo.stock_in_pda_version IS NOT NULL 
+    WHERE wbo.warehouse = 'EP_CL1'
+      AND wbo.stock_in_at > '2024-01-01'
+      AND wbo.bind_pmc = false
+      AND wbo.stock_in_pda_version IS NOT NULL
+    GROUP BY 1, 2, 3
     """
     df = pd.read_sql(sql, conn)
     df.columns = [c.lower() for c in df.columns]
-    df["stock_in_at"] = pd.to_datetime(df["stock_in_at"])
     return df
 
 
+@st.cache_data(ttl=3600)
+def _read_csv_cached(path: str, mtime: float) -> pd.DataFrame:
+    """
+    Cached raw CSV read. The file mtime is part of the cache key so the
+    cache is reused across reruns but invalidated when the file changes.
+
+    Uses pyarrow's CSV reader with an explicit schema when available;
+    numeric columns zero-copy into pandas and stock_in_at comes back
+    already typed.
+    """
+    if _HAS_PYARROW_CSV:
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=_DEMO_CSV_TYPES
+            ),
+        )
+        return table.to_pandas()
+    return pd.read_csv(path)
+
+
+@st.cache_data(ttl=3600)
+def _read_parquet_cached(path: str, mtime: float) -> pd.DataFrame:
+    """
+    Cached Parquet read, keyed on path and mtime like _read_csv_cached.
+    """
+    return pd.read_parquet(path, engine="pyarrow")
+
+
+def _load_demo_frame(parquet_path: Path, csv_path: Path) -> pd.DataFrame:
+    """
+    Load a demo table, preferring Parquet over the original CSV.
+    """
+    if parquet_path.exists():
+        return _read_parquet_cached(
+            str(parquet_path), parquet_path.stat().st_mtime
+        )
+    return _read_csv_cached(str(csv_path), csv_path.stat().st_mtime)
+
+
 def load_dbu_demo() -> pd.DataFrame:
     """
-    Demo mode: load anonymised DBU data from CSV.
+    Demo mode: load anonymised DBU data (Parquet if converted, else CSV).
 
     """
-    df = pd.read_csv(DBU_DEMO_PATH)
+    df = _load_demo_frame(DBU_DEMO_PARQUET, DBU_DEMO_PATH)
     df.columns = [c.lower() for c in df.columns]
 
     if "box_id" in df.columns:
@@ -225,8 +410,11 @@ def load_dbu_demo() -> pd.DataFrame:
             }
         )
 
-    df["stock_in_at"] = pd.to_datetime(df["stock_in_at"])
-    df["transporter"] = "DBU-PMC" 
+    # Parquet already stores the column as datetime64
+    if df["stock_in_at"].dtype.kind != "M":
+        df["stock_in_at"] = pd.to_datetime(df["stock_in_at"])
+    df["transporter"] = "DBU-PMC"
+    df = _downcast_weights(df)
     return df[
         [
             "reference",
@@ -241,12 +429,14 @@ def load_dbu_demo() -> pd.DataFrame:
 
 def load_inrooissy_demo() -> pd.DataFrame:
     """
-    Demo mode: load anonymised inrooissy data from CSV.
+    Demo mode: load anonymised inrooissy data (Parquet if converted, else CSV).
 
     """
-    df = pd.read_csv(INROOISSY_DEMO_PATH)
+    df = _load_demo_frame(INROOISSY_DEMO_PARQUET, INROOISSY_DEMO_PATH)
     df.columns = [c.lower() for c in df.columns]
-    df["stock_in_at"] = pd.to_datetime(df["stock_in_at"])
+    if df["stock_in_at"].dtype.kind != "M":
+        df["stock_in_at"] = pd.to_datetime(df["stock_in_at"])
+    df = _downcast_weights(df)
     return df[
         [
             "reference",
@@ -264,77 +454,109 @@ def build_inrooissy_all(
 ) -> pd.DataFrame:
     """
     Concatenate inrooissy (non-PMC/DBU) with DBU weights.
+
+    Both loaders already deliver stock_in_at as datetime64, so no
+    re-conversion is needed here.
     """
+    assert df_dbu["stock_in_at"].dtype.kind == "M"
+    assert df_inrooissy_no_pmcdbu["stock_in_at"].dtype.kind == "M"
+
     df_inrooissy = pd.concat(
-        [df_inrooissy_no_pmcdbu, df_dbu], ignore_index=True
+        [df_inrooissy_no_pmcdbu, df_dbu], copy=False, ignore_index=True
     )
-    df_inrooissy["stock_in_at"] = pd.to_datetime(df_inrooissy["stock_in_at"])
     return df_inrooissy
 
 
 def summarize_inrooissy(df_inrooissy: pd.DataFrame) -> pd.DataFrame:
     """
     Summarize weight by year-month-transporter.
-    """
-    df = df_inrooissy.copy()
 
-    if "stock_in_at" not in df.columns:
-        raise KeyError(f"'stock_in_at' not in columns: {df.columns.tolist()}")
+    Each row is one stocked box, so 'reference' is unique per row and the
+    box count is a plain group size — no per-group nunique hashing.
+    """
+    if "stock_in_at" not in df_inrooissy.columns:
+        raise KeyError(
+            f"'stock_in_at' not in columns: {df_inrooissy.columns.tolist()}"
+        )
 
-    df["year"] = df["stock_in_at"].dt.year
-    df["month"] = df["stock_in_at"].dt.month
+    # assign() only materialises the new/changed columns instead of
+    # copying the whole frame; to_period walks the datetime buffer once
+    # instead of one pass each for .dt.year and .dt.month, and the
+    # period/categorical keys hash far cheaper than strings in groupby
+    df = df_inrooissy.assign(
+        transporter=df_inrooissy["transporter"].astype("category"),
+        ym=df_inrooissy["stock_in_at"].dt.to_period("M"),
+    )
 
     df_summary = (
-        df.groupby(["year", "month", "transporter"])
+        df.groupby(["ym", "transporter"], observed=True, sort=False)
         .agg(
-            reference_unique=("reference", "nunique"),
+            reference_unique=("reference", "size"),
             total_weight=("weight", "sum"),
             total_netweight=("netweight", "sum"),
         )
         .reset_index()
-        .sort_values(["year", "month", "transporter"])
     )
-    return df_summary
+    df_summary["year"] = df_summary["ym"].dt.year.astype("int16")
+    df_summary["month"] = df_summary["ym"].dt.month.astype("int8")
+    # back to float64 on the small result for the downstream ratio maths
+    df_summary = df_summary.astype(
+        {"total_weight": "float64", "total_netweight": "float64"}
+    )
+    df_summary = df_summary.sort_values(
+        ["year", "month", "transporter"]
+    ).reset_index(drop=True)
+    return df_summary[
+        [
+            "year",
+            "month",
+            "transporter",
+            "reference_unique",
+            "total_weight",
+            "total_netweight",
+        ]
+    ]
 
 
+@st.cache_data(ttl=900)
 def calc_dbu_share(df_summary: pd.DataFrame) -> pd.DataFrame:
     """
     Compute monthly total weight, DBU weight, and DBU share (%)
-    """
-    df = df_summary.copy()
 
-    # total weight (all transporters)
-    month_total = (
-        df.groupby(["year", "month"], as_index=False)["total_weight"]
-        .sum()
-        .rename(columns={"total_weight": "total_weight_all"})
+    Cached so sidebar interactions do not recompute the groupbys; the
+    summary frame is small, so hashing it for the cache key is cheap.
+    """
+    # zero out non-DBU rows so total and DBU weight come out of a single
+    # groupby pass instead of two groupbys plus a merge
+    dbu_weight = df_summary["total_weight"].where(
+        df_summary["transporter"] == "DBU-PMC", 0.0
     )
 
-    # DBU weight = sum over 'DBU-PMC' transporter
-    dbu_mask = df["transporter"] == "DBU-PMC"
-    dbu_total = (
-        df[dbu_mask]
-        .groupby(["year", "month"], as_index=False)["total_weight"]
-        .sum()
-        .rename(columns={"total_weight": "total_weight_dbu"})
+    merged = (
+        df_summary.assign(dbu_weight=dbu_weight)
+        .groupby(["year", "month"], as_index=False, sort=True)
+        .agg(
+            total_weight_all=("total_weight", "sum"),
+            total_weight_dbu=("dbu_weight", "sum"),
+        )
     )
 
-    merged = pd.merge(month_total, dbu_total, on=["year", "month"], how="left")
-    merged["total_weight_dbu"] = merged["total_weight_dbu"].fillna(0)
-
     merged["dbu_ratio"] = np.where(
         merged["total_weight_all"] > 0,
         merged["total_weight_dbu"] / merged["total_weight_all"] * 100,
         np.nan,
     )
 
-    merged["x_label"] = (
-        merged["year"].astype(str)
-        + "-"
-        + merged["month"].astype(str).str.zfill(2)
+    # formatted once here so every chart rebuild reuses the cached strings
+    merged["ratio_label"] = np.where(
+        np.isnan(merged["dbu_ratio"]),
+        "",
+        merged["dbu_ratio"].round(1).astype(str) + "%",
     )
 
-    merged = merged.sort_values(["year", "month"]).reset_index(drop=True)
+    merged["x_label"] = _ym_labels(merged["year"], merged["month"])
+
+    # groupby(sort=True) already returns rows ordered by (year, month)
     return merged
 
 
@@ -354,6 +576,26 @@ def merge_weight_and_price(
     return merged_full
 
 
+@st.cache_data(ttl=900)
+def summary_table(merged_full: pd.DataFrame) -> pd.DataFrame:
+    """
+    Detail table for st.dataframe: sliced and rounded once per data
+    refresh, with pyarrow-backed dtypes so Streamlit's Arrow conversion
+    on each rerun is a no-op.
+    """
+    table = merged_full[
+        [
+            "year",
+            "month",
+            "total_weight_all",
+            "total_weight_dbu",
+            "dbu_ratio",
+            "total_price",
+        ]
+    ].round(2)
+    return table.convert_dtypes(dtype_backend="pyarrow")
+
+
 @st.cache_data(ttl=900) 
 def load_weight_summary(use_demo: bool = USE_DEMO_DATA) -> pd.DataFrame:
     """
@@ -364,19 +606,37 @@ def load_weight_summary(use_demo: bool = USE_DEMO_DATA) -> pd.DataFrame:
     if use_demo:
         df_dbu = load_dbu_demo()
         df_inrooissy_no_pmcdbu = load_inrooissy_demo()
-    else:
-        sf_conn = get_snowflake_connection()
-        pg_conn = get_postgres_connection()
-        try:
-            df_dbu = fetch_dbu_from_snowflake(sf_conn)
-            df_inrooissy_no_pmcdbu = fetch_inrooissy_no_pmcdbu_from_postgres(pg_conn)
-        finally:
-            sf_conn.close()
-            pg_conn.close()
-
-    df_inrooissy = build_inrooissy_all(df_inrooissy_no_pmcdbu, df_dbu)
-    df_summary = summarize_inrooissy(df_inrooissy)
-    return df_summary
+        df_inrooissy = build_inrooissy_all(df_inrooissy_no_pmcdbu, df_dbu)
+        df_summary = summarize_inrooissy(df_inrooissy)
+        return df_summary
+
+    # live mode: the warehouses already aggregated to monthly level, so
+    # just stitch the two summaries together
+    sf_conn = get_snowflake_connection()
+    pg_conn = get_postgres_connection()
+    try:
+        df_dbu_summary = fetch_dbu_summary_from_snowflake(sf_conn)
+        df_inrooissy_summary = fetch_inrooissy_summary_from_postgres(pg_conn)
+    finally:
+        sf_conn.close()
+        pg_conn.close()
+
+    df_summary = pd.concat(
+        [df_inrooissy_summary, df_dbu_summary], copy=False, ignore_index=True
+    )
+    df_summary = df_summary.sort_values(
+        ["year", "month", "transporter"]
+    ).reset_index(drop=True)
+    return df_summary[
+        [
+            "year",
+            "month",
+            "transporter",
+            "reference_unique",
+            "total_weight",
+            "total_netweight",
+        ]
+    ]
 
 
 # ========================
@@ -385,47 +645,65 @@ def load_weight_summary(use_demo: bool = USE_DEMO_DATA) -> pd.DataFrame:
 
 def chart_weight_price_combo(df: pd.DataFrame):
 
-    df2 = df.copy()
-
-    df2["year"] = df2["year"].astype(int)
-    df2["month"] = df2["month"].astype(int)
-
-    df2["x_label"] = (
-        df2["month"].astype(str).str.zfill(2)
-        + "-"
-        + df2["year"].astype(str)
+    # shallow copy: only the two recast columns are materialised
+    df2 = df.assign(
+        year=df["year"].astype(int),
+        month=df["month"].astype(int),
     )
 
+    df2["x_label"] = [
+        "%02d-%04d" % (m, y) for y, m in zip(df2["year"], df2["month"])
+    ]
+
     df2 = df2.sort_values(["month", "year"]).reset_index(drop=True)
 
     # other weight = total - DBU
     df2["other_weight"] = df2["total_weight_all"] - df2["total_weight_dbu"]
 
-    # DBU ratio text labels
-    df2["ratio_label"] = df2["dbu_ratio"].round(1).astype(str) + "%"
+    # only ship the columns the chart actually encodes — Altair would
+    # otherwise serialise every column to JSON
+    df2 = df2[
+        [
+            "x_label",
+            "total_weight_dbu",
+            "other_weight",
+            "total_price",
+            "total_weight_all",
+            "dbu_ratio",
+            "ratio_label",
+        ]
+    ]
+    order = df2["x_label"].tolist()
+
+    # fold the two weight columns in pandas instead of transform_fold,
+    # so the browser gets 2x rows for the bars and 1x for line/text
+    df_melt = df2.melt(
+        id_vars=["x_label"],
+        value_vars=["total_weight_dbu", "other_weight"],
+        var_name="weight_type",
+        value_name="weight",
+    )
+    df_melt["weight_label"] = df_melt["weight_type"].map(
+        {
+            "total_weight_dbu": "DBU Weight",
+            "other_weight": "Other Weight",
+        }
+    )
 
     base = alt.Chart(df2).encode(
         x=alt.X(
             "x_label:N",
         title="Month",
-        sort=df2["x_label"].tolist(),
+        sort=order,
         )
     )
 
     # stacked bars
     bar = (
-        base.transform_fold(
-            ["total_weight_dbu", "other_weight"],
-            as_=["weight_type", "weight"],
-        )
-        .transform_calculate(
-            weight_label=(
-                "datum.weight_type == 'total_weight_dbu' ? "
-                "'DBU Weight' : 'Other Weight'"
-            )
-        )
+        alt.Chart(df_melt)
         .mark_bar()
         .encode(
+            x=alt.X("x_label:N", title="Month", sort=order),
             y=alt.Y(
                 "weight:Q",
                 title="Weight (kg)",
@@ -486,25 +764,31 @@ def chart_weight_price_combo(df: pd.DataFrame):
     return chart
 
 
-def chart_single_month(df: pd.DataFrame, month: int):
+def chart_monthly_facets(df: pd.DataFrame):
     """
-    For a given month (1–12), draw:
-    - Stacked bar: DBU weight + other weight by year
-    - Line: total_price by year
+    Small multiples: one panel per month (3 per row), drawing per year:
+    - Stacked bar: DBU weight + other weight
+    - Line: total_price
     - DBU ratio text labels
-    """
-    df2 = df[df["month"] == month].copy()
-    if df2.empty:
-        return None
-
-    # compute other weight
-    df2["other_weight"] = df2["total_weight_all"] - df2["total_weight_dbu"]
 
-    # DBU ratio text labels
-    df2["ratio_label"] = df2["dbu_ratio"].round(1).astype(str) + "%"
+    Built as a single faceted chart so Streamlit serialises one
+    spec+data payload instead of one per month.
+    """
+    # other weight, without copying the frame; ratio_label comes
+    # precomputed from calc_dbu_share
+    df2 = df.assign(
+        other_weight=df["total_weight_all"] - df["total_weight_dbu"],
+    )
 
     df_melt = df2.melt(
-        id_vars=["year", "month", "total_price", "dbu_ratio", "ratio_label"],
+        id_vars=[
+            "year",
+            "month",
+            "total_price",
+            "dbu_ratio",
+            "ratio_label",
+            "total_weight_all",
+        ],
         value_vars=["total_weight_dbu", "other_weight"],
         var_name="weight_type",
         value_name="weight",
@@ -526,7 +810,10 @@ def chart_single_month(df: pd.DataFrame, month: int):
         x=alt.X("year:O", title="Year")
     )
 
- 
+    # line/text layers only need one row per (year, month), so filter
+    # out the duplicates the melt introduced
+    single = alt.datum.weight_type == "total_weight_dbu"
+
     bars = base.mark_bar().encode(
         y=alt.Y(
             "weight:Q",
@@ -549,7 +836,7 @@ def chart_single_month(df: pd.DataFrame, month: int):
     )
 
 
-    line_price = base.mark_line(
+    line_price = base.transform_filter(single).mark_line(
         point=True, strokeDash=[5, 5], color="red"
     ).encode(
         y=alt.Y(
@@ -567,7 +854,7 @@ def chart_single_month(df: pd.DataFrame, month: int):
         ],
     )
 
-    ratio_text = alt.Chart(df2).mark_text(
+    ratio_text = base.transform_filter(single).mark_text(
         align="center",
         baseline="bottom",
         dy=-5,
@@ -575,7 +862,6 @@ def chart_single_month(df: pd.DataFrame, month: int):
         fontWeight="bold",
         fontSize=9,
     ).encode(
-        x=alt.X("year:O"),
         y=alt.Y("total_weight_all:Q", axis=None),
         text=alt.Text("ratio_label:N"),
         tooltip=[
@@ -587,11 +873,18 @@ def chart_single_month(df: pd.DataFrame, month: int):
 
     chart = (
         alt.layer(bars, line_price, ratio_text)
-        .resolve_scale(y="independent") 
-        .properties(
-            width=280,
-            height=260,
-            padding={"left": 5, "right": 70, "top": 10, "bottom": 40},
+        .resolve_scale(y="independent")
+        .properties(width=280, height=260)
+        .facet(
+            facet=alt.Facet(
+                "month:O",
+                title=None,
+                header=alt.Header(
+                    labelExpr="'Month ' + datum.value",
+                    labelFontWeight="bold",
+                ),
+            ),
+            columns=3,
         )
         .configure_axis(labelFontSize=10, titleFontSize=11)
     )
@@ -682,34 +975,14 @@ def main():
             )
 
             with st.expander("🔍 View detailed data table"):
-                st.dataframe(
-                    merged_full[
-                        [
-                            "year",
-                            "month",
-                            "total_weight_all",
-                            "total_weight_dbu",
-                            "dbu_ratio",
-                            "total_price",
-                        ]
-                    ].round(2)
-                )
-
-            # Small multiples by month
-            st.subheader("📅 Monthly Analysis")
-
-            months = sorted(merged_full["month"].dropna().unique())
-            cols = st.columns(3)  # 3 charts per row
-
-            for idx, m in enumerate(months):
-                chart = chart_single_month(merged_full, m)
-                if chart is None:
-                    continue
+                st.dataframe(summary_table(merged_full))
 
-                col = cols[idx % 3]
-                with col:
-                    st.markdown(f"**Month {int(m)}**")
-                    st.altair_chart(chart, use_container_width=True)
+            # Small multiples by month: one faceted chart, one render call
+            st.subheader("📅 Monthly Analysis")
+            st.altair_chart(
+                chart_monthly_facets(merged_full),
+                use_container_width=True,
+            )
 
         except Exception as e:
             st.error(f"❌ Error while loading or processing weight data: {e}")